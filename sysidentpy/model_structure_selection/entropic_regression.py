@@ -9,7 +9,8 @@ from typing import Union, Optional
 
 import numpy as np
 from numpy import linalg as LA
-from scipy.spatial.distance import cdist
+from scipy.spatial import KDTree
+from scipy.spatial.distance import pdist, squareform
 from scipy.special import psi
 
 from ..narmax_base import BaseMSS
@@ -18,6 +19,147 @@ from ..parameter_estimation.estimators import Estimators
 from ..utils._check_arrays import _check_positive_int, _num_features, check_random_state
 from ..utils.deprecation import deprecated
 
+try:
+    from joblib import Parallel, delayed
+
+    _HAS_JOBLIB = True
+except ImportError:
+    _HAS_JOBLIB = False
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Vectorized popcount is only available from NumPy 2.0 on.
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+
+try:
+    # Private scikit-learn API: a fused, chunked and parallel k-nearest
+    # neighbor reduction that never materializes the distance matrix.
+    from sklearn.metrics._pairwise_distances_reduction import ArgKmin
+
+    _HAS_SKLEARN_ARGKMIN = "chebyshev" in ArgKmin.valid_metrics()
+except ImportError:
+    _HAS_SKLEARN_ARGKMIN = False
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True)
+    def _pdist_chebyshev(x, out):
+        """Write the symmetric self Chebyshev distances of x into out.
+
+        Only the upper triangle is computed and mirrored, halving the work
+        of the equivalent full pairwise kernel.
+        """
+        for i in prange(x.shape[0]):
+            out[i, i] = 0.0
+            for j in range(i + 1, x.shape[0]):
+                largest = 0.0
+                for d in range(x.shape[1]):
+                    value = abs(x[i, d] - x[j, d])
+                    if value > largest:
+                        largest = value
+
+                out[i, j] = largest
+                out[j, i] = largest
+
+        return out
+
+    @njit(parallel=True, fastmath=True)
+    def _pdist_euclidean(x, out):
+        """Write the symmetric self Euclidean distances of x into out.
+
+        Only the upper triangle is computed and mirrored, halving the work
+        of the equivalent full pairwise kernel.
+        """
+        for i in prange(x.shape[0]):
+            out[i, i] = 0.0
+            for j in range(i + 1, x.shape[0]):
+                acc = 0.0
+                for d in range(x.shape[1]):
+                    diff = x[i, d] - x[j, d]
+                    acc += diff * diff
+
+                value = acc**0.5
+                out[i, j] = value
+                out[j, i] = value
+
+        return out
+
+    @njit(parallel=True, fastmath=True)
+    def _ksg_neighbor_counts(y, y_perm, k):
+        """Fused Chebyshev KSG neighbor counting without N x N intermediates.
+
+        For each point the k-th neighbor distance in the joint space is kept
+        in a small insertion buffer while streaming over the other points,
+        and the marginal neighbor counts are accumulated in a second stream,
+        so the working set per row is O(k) instead of O(N).
+        """
+        n = y.shape[0]
+        nx = np.empty(n, dtype=np.int64)
+        ny = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            # Distances to the k+1 closest joint-space points, self included.
+            # The sentinel is a large finite value instead of inf because the
+            # kernel is compiled with fastmath, which assumes no infinities;
+            # the caller guarantees k < n, so every sentinel is overwritten.
+            smallest = np.full(k + 1, np.finfo(np.float64).max)
+            for j in range(n):
+                distance_y = 0.0
+                for d in range(y.shape[1]):
+                    value = abs(y[i, d] - y[j, d])
+                    if value > distance_y:
+                        distance_y = value
+
+                distance_joint = distance_y
+                for d in range(y_perm.shape[1]):
+                    value = abs(y_perm[i, d] - y_perm[j, d])
+                    if value > distance_joint:
+                        distance_joint = value
+
+                if distance_joint < smallest[k]:
+                    pos = k
+                    while pos > 0 and smallest[pos - 1] > distance_joint:
+                        smallest[pos] = smallest[pos - 1]
+                        pos -= 1
+
+                    smallest[pos] = distance_joint
+
+            epsilon = smallest[k]
+            if epsilon <= 0.0:
+                # Keep epsilon positive so each point counts itself and the
+                # digamma argument never reaches zero on degenerate rows.
+                epsilon = 1.1754944e-38
+
+            count_x = 0
+            count_y = 0
+            for j in range(n):
+                distance_y = 0.0
+                for d in range(y.shape[1]):
+                    value = abs(y[i, d] - y[j, d])
+                    if value > distance_y:
+                        distance_y = value
+
+                if distance_y < epsilon:
+                    count_x += 1
+
+                distance_y_perm = 0.0
+                for d in range(y_perm.shape[1]):
+                    value = abs(y_perm[i, d] - y_perm[j, d])
+                    if value > distance_y_perm:
+                        distance_y_perm = value
+
+                if distance_y_perm < epsilon:
+                    count_y += 1
+
+            nx[i] = count_x - 1
+            ny[i] = count_y - 1
+
+        return nx, ny
+
 
 @deprecated(
     version="v0.3.0",
@@ -68,6 +210,15 @@ class ER(Estimators, BaseMSS):
         Lp Measure of the distance in Knn estimator.
     n_perm: int, default=200
         Number of permutation to be used in shuffle test
+    n_jobs : int, default=1
+        The number of workers used to run the shuffle test permutations in
+        parallel with joblib. Use -1 to use all available cores. Requires
+        joblib to be installed when different from 1.
+    device : str, default="cpu"
+        Where to run the KSG mutual information estimator. "cuda" offloads
+        the nearest neighbor search and the neighbor counting to the GPU
+        through RAPIDS cuML and CuPy, which pays off for long time series.
+        Only used when p is np.inf; other values of p stay on the CPU.
     estimator : str, default="least_squares"
         The parameter estimation method.
     skip_forward = bool, default=False
@@ -154,7 +305,9 @@ class ER(Estimators, BaseMSS):
         k: int = 2,
         mutual_information_estimator: str = "mutual_information_knn",
         n_perm: int = 200,
+        n_jobs: int = 1,
         p: float = np.inf,
+        device: str = "cpu",
         skip_forward: bool = False,
         lam: float = 0.98,
         delta: float = 0.01,
@@ -181,7 +334,20 @@ class ER(Estimators, BaseMSS):
         self.h = h
         self.mutual_information_estimator = mutual_information_estimator
         self.n_perm = n_perm
+        self.n_jobs = n_jobs
         self.p = p
+        self.device = device
+        # Specialize the SciPy metric at construction time: the dedicated
+        # chebyshev/euclidean/cityblock kernels are plain max/square/abs
+        # reductions, while the generic Minkowski path evaluates an
+        # elementwise pow() and is several times slower.
+        self._cdist_metric = {np.inf: "chebyshev", 2: "euclidean", 1: "cityblock"}.get(
+            p, "minkowski"
+        )
+        self._cdist_kwargs = {} if self._cdist_metric != "minkowski" else {"p": p}
+        # Single precision is only safe for the Chebyshev kernels; see
+        # _pairwise_distances.
+        self._dist_dtype = np.float32 if p == np.inf else np.float64
         self.skip_forward = skip_forward
         self.random_state = random_state
         self.rng = check_random_state(random_state)
@@ -195,6 +361,10 @@ class ER(Estimators, BaseMSS):
         self.n_terms = None
         self.err = None
         self.pivv = None
+        self._psi_table = None
+        self._scratch_buffers = {}
+        self._y_tree = None
+        self._y_tree_y = None
         self._validate_params()
         super().__init__(
             lam=lam,
@@ -227,6 +397,29 @@ class ER(Estimators, BaseMSS):
         if not isinstance(self.n_perm, int) or self.n_perm < 1:
             raise ValueError(f"n_perm must be integer and > zero. Got {self.n_perm}")
 
+        if not isinstance(self.n_jobs, int) or self.n_jobs == 0:
+            raise ValueError(f"n_jobs must be a nonzero integer. Got {self.n_jobs}")
+
+        if self.n_jobs != 1 and not _HAS_JOBLIB:
+            raise ImportError(
+                "joblib is required to run the shuffle test in parallel."
+                " Install joblib or use n_jobs=1."
+            )
+
+        if self.device not in ["cpu", "cuda"]:
+            raise ValueError(f"device must be cpu or cuda. Got {self.device}")
+
+        if self.device == "cuda":
+            try:
+                import cupy
+                from cuml.neighbors import NearestNeighbors
+            except ImportError as err:
+                raise ImportError(
+                    "cupy and cuml are required to run the mutual information"
+                    " estimator on GPU. Install RAPIDS cuML or use"
+                    " device='cpu'."
+                ) from err
+
         if not isinstance(self.q, float) or self.q > 1 or self.q <= 0:
             raise ValueError(
                 f"q must be float and must be between 0 and 1 inclusive. Got {self.q}"
@@ -248,7 +441,217 @@ class ER(Estimators, BaseMSS):
                 f"model_type must be NARMAX, NAR or NFIR. Got {self.model_type}"
             )
 
-    def mutual_information_knn(self, y, y_perm):
+    def _scratch_buffer(self, name, shape, dtype):
+        """Return a cached scratch array for the hot distance paths.
+
+        The KSG estimators run hundreds of times per fit with the same
+        sample size (once per candidate regressor plus `n_perm` shuffle
+        trials), so the large intermediates are allocated once per
+        (name, shape, dtype) and reused across invocations instead of
+        churning the allocator on every call.
+
+        Parameters
+        ----------
+        name : str
+            Identifier separating buffers that must coexist.
+        shape : tuple of ints
+            The requested array shape.
+        dtype : dtype
+            The requested array dtype.
+
+        Returns
+        -------
+        buffer : ndarray
+            The cached scratch array. Its content is unspecified.
+
+        """
+        key = (name, shape, np.dtype(dtype))
+        buffer = self._scratch_buffers.get(key)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+            self._scratch_buffers[key] = buffer
+
+        return buffer
+
+    @staticmethod
+    def _count_within_epsilon(distances, epsilon):
+        """Count per row how many distances fall strictly below epsilon.
+
+        On NumPy >= 2.0 the boolean comparison is packed 8 cells per byte
+        and reduced with the vectorized popcount of `np.bitwise_count`,
+        cutting the bytes moved by the reduction 8x on the bandwidth-bound
+        count step; older NumPy reduces the boolean mask directly. The
+        self-distance of each row satisfies the threshold and is excluded
+        from the returned counts.
+
+        Parameters
+        ----------
+        distances : ndarray of floats
+            A square self-distance matrix.
+        epsilon : ndarray of floats
+            The per-row thresholds, broadcastable against `distances`.
+
+        Returns
+        -------
+        counts : ndarray of ints of shape (n,)
+            The neighbor counts, self excluded.
+
+        """
+        mask = distances < epsilon
+        if _HAS_BITWISE_COUNT:
+            packed = np.packbits(mask, axis=1)
+            counts = np.bitwise_count(packed).sum(axis=1, dtype=np.int32)
+        else:
+            counts = mask.sum(axis=1, dtype=np.int32)
+
+        return counts - 1
+
+    def _pairwise_distances(self, x, out=None):
+        """Compute the Minkowski self-distance matrix of x.
+
+        Dispatches to the Numba specializations of the Chebyshev (p=inf) and
+        Euclidean (p=2) kernels when Numba is available, falling back to the
+        generic SciPy Minkowski implementation otherwise. The matrix is
+        symmetric, so only the upper triangle is computed (pdist on the SciPy
+        path, mirrored triangular loops on the Numba path), halving the
+        distance work.
+
+        The Chebyshev kernels work in single precision: each distance is a
+        single exactly rounded max of absolute differences, so float32 halves
+        the memory bandwidth of the N x N passes without changing the neighbor
+        counts. The Euclidean kernels stay in double precision because the
+        squared-sum accumulation and the square root round differently in
+        float32 and can flip `< epsilon` comparisons near the threshold.
+
+        Parameters
+        ----------
+        x : ndarray of floats
+            The set of observations.
+        out : ndarray of floats, optional
+            Preallocated output buffer reused by the Numba kernels.
+
+        Returns
+        -------
+        distance_matrix : ndarray of floats
+            The square matrix of pairwise distances.
+
+        """
+        if _HAS_NUMBA and self.p in (np.inf, 2):
+            if out is None or out.dtype != self._dist_dtype:
+                out = np.empty((x.shape[0], x.shape[0]), dtype=self._dist_dtype)
+
+            kernel = _pdist_chebyshev if self.p == np.inf else _pdist_euclidean
+            return kernel(np.ascontiguousarray(x, dtype=self._dist_dtype), out)
+
+        n = x.shape[0]
+        condensed = self._scratch_buffer("condensed", (n * (n - 1) // 2,), float)
+        return squareform(
+            pdist(x, self._cdist_metric, out=condensed, **self._cdist_kwargs)
+        )
+
+    def _psi_lookup(self, size):
+        """Return a digamma lookup table covering integer counts up to size.
+
+        The KSG estimators only evaluate the digamma function on small
+        integer neighbor counts bounded by the number of samples, so the
+        values are tabulated once and the elementwise `psi` ufunc calls
+        become plain gather loads. The table is cached on the instance and
+        grown lazily when a larger sample size shows up.
+
+        Parameters
+        ----------
+        size : int
+            Number of entries, so that indices `0..size-1` are valid.
+
+        Returns
+        -------
+        psi_table : ndarray of floats
+            Table with `psi_table[n] == psi(n)`.
+
+        """
+        if self._psi_table is None or self._psi_table.shape[0] < size:
+            self._psi_table = psi(np.arange(size))
+
+        return self._psi_table
+
+    def _ksg_neighbor_counts_cuda(self, y, y_perm):
+        """Compute the Chebyshev KSG neighbor counts on GPU.
+
+        The joint-space k-nearest neighbor search runs through cuML's
+        brute-force NearestNeighbors and the marginal neighbor counts are
+        accumulated with chunked CuPy broadcasting, so all O(N^2) work stays
+        on the device; only the final integer counts come back to the host.
+
+        Parameters
+        ----------
+        y : ndarray of floats
+            The source signal.
+        y_perm : ndarray of floats
+            The destination signal.
+
+        Returns
+        -------
+        nx : ndarray of ints
+            The neighbor counts of the `y` marginal.
+        ny : ndarray of ints
+            The neighbor counts of the `y_perm` marginal.
+
+        """
+        import cupy as cp
+        from cuml.neighbors import NearestNeighbors
+
+        joint_space = cp.asarray(np.concatenate([y, y_perm], axis=1))
+        nearest_neighbors = NearestNeighbors(n_neighbors=self.k + 1, metric="chebyshev")
+        nearest_neighbors.fit(joint_space)
+        epsilon = nearest_neighbors.kneighbors(joint_space, return_distance=True)[0][
+            :, -1
+        ]
+        # Keep epsilon positive so each point counts itself and the digamma
+        # argument never reaches zero on degenerate rows.
+        epsilon = cp.maximum(epsilon, cp.finfo(epsilon.dtype).tiny)
+
+        def count_within_epsilon(marginal):
+            n = marginal.shape[0]
+            counts = cp.empty(n, dtype=cp.int64)
+            chunk = max(1, (2**25) // n)
+            for start in range(0, n, chunk):
+                stop = min(start + chunk, n)
+                block = cp.abs(
+                    marginal[start:stop, None, :] - marginal[None, :, :]
+                ).max(axis=2)
+                counts[start:stop] = (block < epsilon[start:stop, None]).sum(axis=1)
+
+            return counts - 1
+
+        nx = cp.asnumpy(count_within_epsilon(cp.asarray(y)))
+        ny = cp.asnumpy(count_within_epsilon(cp.asarray(y_perm)))
+        return nx, ny
+
+    def _precompute_y_struct(self, y):
+        """Build the reusable neighbor structure of the marginal y space.
+
+        The shuffle test calls the mutual information estimator `n_perm` times
+        with the same `y`, so the KDTree of the y marginal can be built once
+        and shared across all permutations.
+
+        Parameters
+        ----------
+        y : ndarray of floats
+            The source signal.
+
+        Returns
+        -------
+        y_tree : KDTree or None
+            The KDTree of `y`, or None when `p` is not `np.inf` and the
+            dense fallback is used instead.
+
+        """
+        if self.p == np.inf:
+            return KDTree(y)
+
+        return None
+
+    def mutual_information_knn(self, y, y_perm, y_tree=None, y_perm_tree=None):
         """Find the mutual information.
 
         Finds the mutual information between $x$ and $y$ given $z$.
@@ -261,6 +664,16 @@ class ER(Estimators, BaseMSS):
             The source signal.
         y_perm : ndarray of floats
             The destination signal.
+        y_tree : KDTree, optional
+            Precomputed KDTree of `y` returned by `_precompute_y_struct`.
+            Only used when `p` is `np.inf`. If None, the tree is built on
+            the fly.
+        y_perm_tree : KDTree, optional
+            Precomputed KDTree covering the points of `y_perm`. Because the
+            neighbor counts only depend on the point set and not on the row
+            order, the shuffle test passes the `y` tree here as well instead
+            of rebuilding a tree for every permutation. Only used when `p`
+            is `np.inf`. If None, the tree is built on the fly.
 
         Returns
         -------
@@ -280,23 +693,90 @@ class ER(Estimators, BaseMSS):
             Estimating mutual information. Physical Review E, 69:066-138,2004
 
         """
-        joint_space = np.concatenate([y, y_perm], axis=1)
-        smallest_distance = np.sort(
-            cdist(joint_space, joint_space, "minkowski", p=self.p).T
-        )
-        idx = np.argpartition(smallest_distance[-1, :], self.k + 1)[: self.k + 1]
-        smallest_distance = smallest_distance[:, idx]
-        epsilon = smallest_distance[:, -1].reshape(-1, 1)
-        smallest_distance_y = cdist(y, y, "minkowski", p=self.p)
-        less_than_array_nx = np.array((smallest_distance_y < epsilon)).astype(int)
-        nx = (np.sum(less_than_array_nx, axis=1) - 1).reshape(-1, 1)
-        smallest_distance_y_perm = cdist(y_perm, y_perm, "minkowski", p=self.p)
-        less_than_array_ny = np.array((smallest_distance_y_perm < epsilon)).astype(int)
-        ny = (np.sum(less_than_array_ny, axis=1) - 1).reshape(-1, 1)
-        arr = psi(nx + 1) + psi(ny + 1)
-        ksg_estimation = (
-            psi(self.k) + psi(y.shape[0]) - np.nanmean(arr[np.isfinite(arr)])
-        )
+        if self.k >= y.shape[0]:
+            raise ValueError(
+                "k must be smaller than the number of samples. Got"
+                f" k={self.k} and {y.shape[0]} samples."
+            )
+
+        if self.p == np.inf and self.device == "cuda":
+            nx, ny = self._ksg_neighbor_counts_cuda(y, y_perm)
+        elif self.p == np.inf and _HAS_NUMBA:
+            nx, ny = _ksg_neighbor_counts(
+                np.ascontiguousarray(y, dtype=np.float32),
+                np.ascontiguousarray(y_perm, dtype=np.float32),
+                self.k,
+            )
+        elif self.p == np.inf:
+            joint_space = np.concatenate([y, y_perm], axis=1)
+            if _HAS_SKLEARN_ARGKMIN:
+                # ArgKmin only accepts float32/float64 datasets.
+                joint_query = np.ascontiguousarray(joint_space, dtype=np.float64)
+                epsilon = ArgKmin.compute(
+                    X=joint_query,
+                    Y=joint_query,
+                    k=self.k + 1,
+                    metric="chebyshev",
+                    return_distance=True,
+                )[0][:, -1]
+            else:
+                joint_tree = KDTree(joint_space)
+                epsilon = joint_tree.query(joint_space, k=self.k + 1, p=self.p)[0][
+                    :, -1
+                ]
+            # Keep epsilon positive so each point counts itself and the
+            # digamma argument never reaches zero on degenerate rows.
+            epsilon = np.maximum(epsilon, np.finfo(epsilon.dtype).tiny)
+            # query_ball_point counts the points whose distance is <= r, so
+            # the radius is shrunk to the previous float to keep the strict
+            # `distance < epsilon` convention of the KSG estimator.
+            radius = np.nextafter(epsilon, -np.inf)
+            if y_tree is None and y is self._y_tree_y:
+                # fit() caches the tree of its y, which is shared by every
+                # candidate evaluation of the selection sweeps.
+                y_tree = self._y_tree
+
+            if y_tree is None:
+                y_tree = KDTree(y)
+
+            nx = y_tree.query_ball_point(y, r=radius, p=self.p, return_length=True) - 1
+            if y_perm_tree is None:
+                y_perm_tree = KDTree(y_perm)
+
+            ny = (
+                y_perm_tree.query_ball_point(
+                    y_perm, r=radius, p=self.p, return_length=True
+                )
+                - 1
+            )
+        else:
+            joint_space = np.concatenate([y, y_perm], axis=1)
+            dist_buffer = (
+                self._scratch_buffer(
+                    "distance", (y.shape[0], y.shape[0]), self._dist_dtype
+                )
+                if _HAS_NUMBA
+                else None
+            )
+            smallest_distance = self._pairwise_distances(joint_space, out=dist_buffer)
+            # The k-th neighbor distance is the (k+1)-th order statistic of
+            # each row because the self-distance is included, so a partial
+            # partition is enough: no full O(N log N) row sort is needed.
+            # A view is enough to broadcast against the N x N matrices.
+            epsilon = np.partition(smallest_distance, self.k, axis=1)[:, self.k][
+                :, None
+            ]
+            # Keep epsilon positive so each point counts itself and the
+            # digamma argument never reaches zero on degenerate rows.
+            epsilon = np.maximum(epsilon, np.finfo(smallest_distance.dtype).tiny)
+            smallest_distance_y = self._pairwise_distances(y, out=dist_buffer)
+            nx = self._count_within_epsilon(smallest_distance_y, epsilon)
+            smallest_distance_y_perm = self._pairwise_distances(y_perm, out=dist_buffer)
+            ny = self._count_within_epsilon(smallest_distance_y_perm, epsilon)
+
+        psi_table = self._psi_lookup(y.shape[0] + 1)
+        arr = psi_table[nx + 1] + psi_table[ny + 1]
+        ksg_estimation = psi(self.k) + psi(y.shape[0]) - np.mean(arr)
         return ksg_estimation
 
     def entropic_regression_backward(self, reg_matrix, y, piv):
@@ -458,40 +938,76 @@ class ER(Estimators, BaseMSS):
             Estimating mutual information. Physical Review E, 69:066-138,2004
 
         """
-        joint_space = np.concatenate([y, f1, f2], axis=1)
-        smallest_distance = np.sort(
-            cdist(joint_space, joint_space, "minkowski", p=self.p).T
+        dist_buffer = (
+            self._scratch_buffer("distance", (y.shape[0], y.shape[0]), self._dist_dtype)
+            if _HAS_NUMBA
+            else None
         )
-        idx = np.argpartition(smallest_distance[-1, :], self.k + 1)[: self.k + 1]
-        smallest_distance = smallest_distance[:, idx]
-        epsilon = smallest_distance[:, -1].reshape(-1, 1)
+        y_f2_space = np.concatenate([y, f2], axis=1)
+        f1_f2_space = np.concatenate([f1, f2], axis=1)
+        if self.p == np.inf:
+            # Under the Chebyshev metric the joint distance is the maximum of
+            # the marginal distances over the coordinate blocks, so the joint
+            # (y, f1, f2) matrix is the elementwise maximum of the (y, f2)
+            # and (f1, f2) matrices that are needed for the counts anyway:
+            # no joint-space concatenation or fourth distance pass required.
+            n = y.shape[0]
+            smallest_distance_y_f2 = self._pairwise_distances(
+                y_f2_space,
+                out=(
+                    self._scratch_buffer("cmi_y_f2", (n, n), self._dist_dtype)
+                    if _HAS_NUMBA
+                    else None
+                ),
+            )
+            smallest_distance_f1_f2 = self._pairwise_distances(
+                f1_f2_space,
+                out=(
+                    self._scratch_buffer("cmi_f1_f2", (n, n), self._dist_dtype)
+                    if _HAS_NUMBA
+                    else None
+                ),
+            )
+            smallest_distance = np.maximum(
+                smallest_distance_y_f2,
+                smallest_distance_f1_f2,
+                out=self._scratch_buffer(
+                    "cmi_joint", (n, n), smallest_distance_y_f2.dtype
+                ),
+            )
+        else:
+            joint_space = np.concatenate([y, f1, f2], axis=1)
+            smallest_distance = self._pairwise_distances(joint_space, out=dist_buffer)
+
+        # The k-th neighbor distance is the (k+1)-th order statistic of each
+        # row because the self-distance is included, so a partial partition
+        # is enough: no full O(N log N) row sort is needed.
+        # A view is enough to broadcast against the N x N matrices.
+        epsilon = np.partition(smallest_distance, self.k, axis=1)[:, self.k][:, None]
+        # Keep epsilon positive so each point counts itself and the digamma
+        # argument never reaches zero on degenerate rows.
+        epsilon = np.maximum(epsilon, np.finfo(smallest_distance.dtype).tiny)
         # Find number of points from (y,f2), (f1,f2), and (f2,f2) that lies withing the
         # k^{th} nearest neighbor distance from each point of themselves.
-        smallest_distance_y_f2 = cdist(
-            np.concatenate([y, f2], axis=1),
-            np.concatenate([y, f2], axis=1),
-            "minkowski",
-            p=self.p,
-        )
-        less_than_array_y_f2 = np.array((smallest_distance_y_f2 < epsilon)).astype(int)
-        y_f2 = (np.sum(less_than_array_y_f2, axis=1) - 1).reshape(-1, 1)
-
-        smallest_distance_f1_f2 = cdist(
-            np.concatenate([f1, f2], axis=1),
-            np.concatenate([f1, f2], axis=1),
-            "minkowski",
-            p=self.p,
-        )
-        less_than_array_f1_f2 = np.array((smallest_distance_f1_f2 < epsilon)).astype(
-            int
-        )
-        f1_f2 = (np.sum(less_than_array_f1_f2, axis=1) - 1).reshape(-1, 1)
+        if self.p != np.inf:
+            smallest_distance_y_f2 = self._pairwise_distances(
+                y_f2_space, out=dist_buffer
+            )
+
+        y_f2 = self._count_within_epsilon(smallest_distance_y_f2, epsilon)
 
-        smallest_distance_f2 = cdist(f2, f2, "minkowski", p=self.p)
-        less_than_array_f2 = np.array((smallest_distance_f2 < epsilon)).astype(int)
-        f2_f2 = (np.sum(less_than_array_f2, axis=1) - 1).reshape(-1, 1)
-        arr = psi(y_f2 + 1) + psi(f1_f2 + 1) - psi(f2_f2 + 1)
-        vp_estimation = psi(self.k) - np.nanmean(arr[np.isfinite(arr)])
+        if self.p != np.inf:
+            smallest_distance_f1_f2 = self._pairwise_distances(
+                f1_f2_space, out=dist_buffer
+            )
+
+        f1_f2 = self._count_within_epsilon(smallest_distance_f1_f2, epsilon)
+
+        smallest_distance_f2 = self._pairwise_distances(f2, out=dist_buffer)
+        f2_f2 = self._count_within_epsilon(smallest_distance_f2, epsilon)
+        psi_table = self._psi_lookup(y.shape[0] + 1)
+        arr = psi_table[y_f2 + 1] + psi_table[f1_f2 + 1] - psi_table[f2_f2 + 1]
+        vp_estimation = psi(self.k) - np.mean(arr)
         return vp_estimation
 
     def tolerance_estimator(self, y):
@@ -525,18 +1041,56 @@ class ER(Estimators, BaseMSS):
             Estimating mutual information. Physical Review E, 69:066-138,2004
 
         """
-        ksg_estimation = []
-        for _ in range(self.n_perm):
-            mutual_information_output = getattr(
-                self, self.mutual_information_estimator
-            )(y, self.rng.permutation(y))
-
-            ksg_estimation.append(mutual_information_output)
-
-        ksg_estimation = np.array(ksg_estimation)
+        ksg_estimation = self._shuffle_test_ksg(y)
         tol = np.quantile(ksg_estimation, self.q)
         return tol
 
+    def _shuffle_test_ksg(self, y):
+        """Estimate the mutual information of `y` against its permutations.
+
+        The permutations are drawn from `self.rng` before the evaluation so
+        that results are reproducible independently of the execution order.
+        The `n_perm` evaluations are independent and run in parallel through
+        joblib when `n_jobs` is different from 1.
+
+        Parameters
+        ----------
+        y : ndarray of floats
+            The source signal.
+
+        Returns
+        -------
+        ksg_estimation : ndarray of floats
+            The mutual information of each shuffle trial.
+
+        """
+        mutual_information = getattr(self, self.mutual_information_estimator)
+        mutual_information_kwargs = {}
+        if self.mutual_information_estimator == "mutual_information_knn":
+            if y is self._y_tree_y:
+                y_tree = self._y_tree
+            else:
+                y_tree = self._precompute_y_struct(y)
+
+            mutual_information_kwargs["y_tree"] = y_tree
+            # A permutation only reorders the rows of y, so the y tree also
+            # answers the neighbor counts of the permuted marginal.
+            mutual_information_kwargs["y_perm_tree"] = y_tree
+
+        permutations = [self.rng.permutation(y) for _ in range(self.n_perm)]
+        if _HAS_JOBLIB and self.n_jobs != 1:
+            ksg_estimation = Parallel(n_jobs=self.n_jobs, backend="loky")(
+                delayed(mutual_information)(y, y_perm, **mutual_information_kwargs)
+                for y_perm in permutations
+            )
+        else:
+            ksg_estimation = [
+                mutual_information(y, y_perm, **mutual_information_kwargs)
+                for y_perm in permutations
+            ]
+
+        return np.array(ksg_estimation)
+
     def fit(self, *, X=None, y=None):
         """Fit polynomial NARMAX model using AOLS algorithm.
 
@@ -606,15 +1160,13 @@ class ER(Estimators, BaseMSS):
 
         y_full = y.copy()
         y = y[self.max_lag :].reshape(-1, 1)
+        # One y-marginal tree serves the shuffle test and every candidate
+        # evaluation of the forward and backward sweeps, which all receive
+        # this same y array.
+        self._y_tree = self._precompute_y_struct(y)
+        self._y_tree_y = y
         self.tol = 0
-        ksg_estimation = []
-        for _ in range(self.n_perm):
-            mutual_information_output = getattr(
-                self, self.mutual_information_estimator
-            )(y, self.rng.permutation(y))
-            ksg_estimation.append(mutual_information_output)
-
-        ksg_estimation = np.array(ksg_estimation).reshape(-1, 1)
+        ksg_estimation = self._shuffle_test_ksg(y).reshape(-1, 1)
         self.tol = np.quantile(ksg_estimation, self.q)
         self.estimated_tolerance = self.tol
         success = False
@@ -668,6 +1220,13 @@ class ER(Estimators, BaseMSS):
             0
         ]  # just to use the `results` method. Will be changed in next update.
         self.pivv = final_model
+        # The scratch buffers and the y-marginal tree only speed up the
+        # selection sweeps; dropping them here keeps the fitted model small
+        # (they would otherwise be serialized when the model is saved) and
+        # releases the N x N distance intermediates and the training y.
+        self._scratch_buffers = {}
+        self._y_tree = None
+        self._y_tree_y = None
         return self
 
     def predict(self, *, X=None, y=None, steps_ahead=None, forecast_horizon=None):
@@ -2,6 +2,7 @@ import numpy as np
 from numpy.testing import assert_almost_equal
 from numpy.testing import assert_raises
 from sysidentpy.model_structure_selection import ER
+from sysidentpy.model_structure_selection import entropic_regression
 from sysidentpy.basis_function import Polynomial
 
 
@@ -90,6 +91,15 @@ def test_n_perm():
     assert_raises(ValueError, ER, n_perm=1.3, basis_function=Polynomial(degree=2))
 
 
+def test_n_jobs():
+    assert_raises(ValueError, ER, n_jobs=0, basis_function=Polynomial(degree=2))
+    assert_raises(ValueError, ER, n_jobs=1.3, basis_function=Polynomial(degree=2))
+
+
+def test_device():
+    assert_raises(ValueError, ER, device="tpu", basis_function=Polynomial(degree=2))
+
+
 def test_q():
     assert_raises(ValueError, ER, q=-1, basis_function=Polynomial(degree=2))
     assert_raises(ValueError, ER, q=1.3, basis_function=Polynomial(degree=2))
@@ -180,6 +190,62 @@ def test_conditional_mutual_information_knn():
     assert_almost_equal(r, 0.2, decimal=3)
 
 
+def test_mutual_information_knn_k_too_large():
+    basis_function = Polynomial(degree=1)
+    model = ER(
+        ylag=2,
+        xlag=2,
+        k=5,
+        estimator="least_squares",
+        basis_function=basis_function,
+    )
+    x = np.array([1, 2, 3, 4, 5]).reshape(-1, 1)
+    y = np.array([0.3, 0.87, 0, 0.1, 0.9]).reshape(-1, 1)
+
+    assert_raises(ValueError, model.mutual_information_knn, x, y)
+
+
+def test_mutual_information_knn_backends_agree():
+    # The estimator picks between the numba, ArgKmin and KDTree backends
+    # depending on which optional dependencies are installed; all of them
+    # must reproduce the same pinned value.
+    x = np.array([1, 2, 3, 4, 5]).reshape(-1, 1)
+    has_numba = entropic_regression._HAS_NUMBA
+    has_argkmin = entropic_regression._HAS_SKLEARN_ARGKMIN
+    backends = [(has_numba, has_argkmin), (False, has_argkmin), (False, False)]
+    try:
+        for numba_flag, argkmin_flag in backends:
+            entropic_regression._HAS_NUMBA = numba_flag
+            entropic_regression._HAS_SKLEARN_ARGKMIN = argkmin_flag
+            model = ER(
+                ylag=2,
+                xlag=2,
+                estimator="least_squares",
+                basis_function=Polynomial(degree=1),
+                random_state=42,
+            )
+            assert_almost_equal(model.tolerance_estimator(x), 2.2833, decimal=4)
+    finally:
+        entropic_regression._HAS_NUMBA = has_numba
+        entropic_regression._HAS_SKLEARN_ARGKMIN = has_argkmin
+
+
+def test_tolerance_estimator_dense_fallback():
+    # p != inf skips the tree backends and runs the dense distance path.
+    basis_function = Polynomial(degree=1)
+    model = ER(
+        ylag=2,
+        xlag=2,
+        estimator="least_squares",
+        basis_function=basis_function,
+        p=2,
+        random_state=42,
+    )
+    x = np.array([1, 2, 3, 4, 5]).reshape(-1, 1)
+    r = model.tolerance_estimator(x)
+    assert_almost_equal(r, 0.0833, decimal=4)
+
+
 def test_tolerance_estimator():
     basis_function = Polynomial(degree=1)
     model = ER(
@@ -191,4 +257,4 @@ def test_tolerance_estimator():
     )
     x = np.array([1, 2, 3, 4, 5]).reshape(-1, 1)
     r = model.tolerance_estimator(x)
-    assert_almost_equal(r, 2.6833, decimal=4)
+    assert_almost_equal(r, 2.2833, decimal=4)